@@ -1,13 +1,56 @@
 import streamlit as st
-import whisper
+from faster_whisper import BatchedInferencePipeline, WhisperModel, decode_audio
+from faster_whisper.vad import VadOptions, get_speech_timestamps, merge_segments
 import tempfile
 import os
-import moviepy.editor as mp
-import datetime
-import pysrt
-import webvtt
-from pathlib import Path
+import shutil
+import io
+import hashlib
+import importlib.util
+import numpy as np
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+from types import SimpleNamespace
+import ctranslate2
+import transcription_worker
+from wav_reader import read_pcm_wav
+
+SAMPLE_RATE = 16000
+
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mkv', '.mov')
+
+# Files shorter than this (in seconds) skip the batched pipeline to avoid its overhead
+BATCHED_MIN_DURATION = 60
+
+# Batch sizes for the batched pipeline, smaller for larger models to fit in memory
+BATCH_SIZES = {"tiny": 16, "base": 16, "small": 8, "medium": 8, "large": 4}
+
+# Number of finished transcriptions kept per session
+TRANSCRIPTION_CACHE_SIZE = 8
+
+# Number of new segments between live transcript updates in the UI
+STREAM_UPDATE_EVERY = 5
+
+# Transcripts longer than this many characters are shown in pages of TRANSCRIPT_PAGE_SIZE characters
+TRANSCRIPT_PAGE_THRESHOLD = 100_000
+TRANSCRIPT_PAGE_SIZE = 20_000
+
+# Exported OpenVINO models and their compiled graphs are kept here between runs
+OV_CACHE_DIR = "./ov_cache"
+
+# Hugging Face checkpoints for the OpenVINO backend
+OV_MODEL_IDS = {
+    "tiny": "openai/whisper-tiny",
+    "base": "openai/whisper-base",
+    "small": "openai/whisper-small",
+    "medium": "openai/whisper-medium",
+    "large": "openai/whisper-large-v3"
+}
+
+# Silence longer than 500 ms is cut before decoding; voiced regions are merged into windows of up to 30 s
+VAD_OPTIONS = VadOptions(min_silence_duration_ms=500, max_speech_duration_s=30)
 
 def check_ffmpeg():
     """Check if FFmpeg is available"""
@@ -25,47 +68,345 @@ def extract_audio_from_video(video_path):
             "If you're using Streamlit Cloud, make sure packages.txt contains 'ffmpeg'."
         )
     
-    with st.spinner("Extracting audio from video..."):
+    try:
+        # Decode straight to 16 kHz mono PCM on stdout, skipping the intermediate WAV file.
+        # Only the first audio stream is mapped, so video, subtitle and data packets are never decoded.
+        proc = subprocess.run(
+            [
+                "ffmpeg", "-nostdin", "-loglevel", "error", "-i", video_path,
+                "-map", "0:a:0", "-vn", "-sn", "-dn",
+                "-ac", "1", "-ar", str(SAMPLE_RATE), "-f", "s16le", "-"
+            ],
+            check=True,
+            capture_output=True
+        )
+        return np.frombuffer(proc.stdout, np.int16).astype(np.float32) / 32768.0
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Error extracting audio: {e.stderr.decode(errors='ignore').strip()}")
+
+def has_cuda():
+    """Check if a CUDA GPU is available to CTranslate2"""
+    return ctranslate2.get_cuda_device_count() > 0
+
+def get_compute_type(mode):
+    """Pick the CTranslate2 compute type for the current device and quality mode"""
+    if use_openvino():
+        # OpenVINO chooses its own precision, so every mode maps to the same cached model
+        return None
+    if not has_cuda():
+        return "int8" if mode == "Speed" else "float32"
+    if mode == "Quality":
+        return "float16"
+    # int8 weights with float16 activations need Turing (compute capability 7.5) or newer
+    if "int8_float16" in ctranslate2.get_supported_compute_types("cuda"):
+        return "int8_float16"
+    return "int8"
+
+def use_openvino():
+    """Check if the optional OpenVINO backend should be used: no CUDA GPU and optimum-intel installed"""
+    if has_cuda() or importlib.util.find_spec("optimum") is None:
+        return False
+    return importlib.util.find_spec("optimum.intel") is not None
+
+def load_openvino_model(name):
+    """Build an OpenVINO Whisper pipeline, exporting the model only on first use"""
+    # Imported here since these are heavy and only needed on the OpenVINO path
+    from optimum.intel import OVModelForSpeechSeq2Seq
+    from transformers import AutoProcessor, pipeline
+
+    model_id = OV_MODEL_IDS[name]
+    export_dir = os.path.join(OV_CACHE_DIR, model_id)
+    ov_config = {"CACHE_DIR": OV_CACHE_DIR, "PERFORMANCE_HINT": "LATENCY"}
+    if os.path.isdir(export_dir):
+        model = OVModelForSpeechSeq2Seq.from_pretrained(export_dir, ov_config=ov_config)
+        processor = AutoProcessor.from_pretrained(export_dir)
+    else:
+        model = OVModelForSpeechSeq2Seq.from_pretrained(model_id, export=True, ov_config=ov_config)
+        processor = AutoProcessor.from_pretrained(model_id)
+        # Save into a scratch directory and move it into place, so an interrupted save is never mistaken for an export
+        os.makedirs(os.path.dirname(export_dir), exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(dir=os.path.dirname(export_dir))
         try:
-            video = mp.VideoFileClip(video_path)
-            audio_path = video_path + ".wav"
-            video.audio.write_audiofile(audio_path, verbose=False, logger=None)
-            video.close()
-            return audio_path
-        except Exception as e:
-            raise RuntimeError(f"Error extracting audio: {str(e)}")
+            model.save_pretrained(tmp_dir)
+            processor.save_pretrained(tmp_dir)
+            os.replace(tmp_dir, export_dir)
+        except OSError:
+            # Another process may have finished the same export first
+            if not os.path.isdir(export_dir):
+                raise
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    return pipeline(
+        "automatic-speech-recognition",
+        model=model,
+        tokenizer=processor.tokenizer,
+        feature_extractor=processor.feature_extractor
+    )
+
+def warm_up_model(model):
+    """Run a silent dummy input through the model so the first real request hits a warm graph"""
+    try:
+        if isinstance(model, WhisperModel):
+            segments, _ = model.transcribe(np.zeros(SAMPLE_RATE, np.float32))
+            # Segments are generated lazily, so consume them to actually run the decoder
+            list(segments)
+        else:
+            # OpenVINO compiles for the canonical 30 s input shape
+            model({"raw": np.zeros(30 * SAMPLE_RATE, np.float32), "sampling_rate": SAMPLE_RATE})
+    except Exception:
+        pass
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def get_whisper_model(name, compute_type):
+    """Load a Whisper model once and reuse it across reruns"""
+    if has_cuda():
+        model = WhisperModel(name, device="cuda", compute_type=compute_type)
+    elif use_openvino():
+        model = load_openvino_model(name)
+    else:
+        model = WhisperModel(name, device="cpu", compute_type=compute_type)
+    warm_up_model(model)
+    return model
+
+@st.cache_resource(show_spinner=False)
+def preload_default_model():
+    """Load the default model once per process, so later reruns don't keep it pinned in the model cache"""
+    # Best effort only: a failure here must not block the page, and the real load reports it on Transcribe
+    try:
+        compute_type = get_compute_type(QUALITY_MODES[0])
+        workers = get_worker_count()
+        # With a worker pool, models only live in the workers, so nothing is loaded on a device in this process
+        if use_worker_pool(workers):
+            get_worker_pool(WHISPER_MODELS[0], compute_type, workers)
+        else:
+            get_whisper_model(WHISPER_MODELS[0], compute_type)
+    except Exception:
+        pass
+
+def transcribe_openvino(ov_pipeline, audio, speech_chunks):
+    """Transcribe voiced chunks with the OpenVINO pipeline, offsetting times back onto the original audio"""
+    inputs = [{"raw": audio[chunk["start"]:chunk["end"]], "sampling_rate": SAMPLE_RATE} for chunk in speech_chunks]
+    outputs = ov_pipeline(inputs, return_timestamps=True)
+    segments = []
+    for chunk, output in zip(speech_chunks, outputs):
+        offset = chunk["start"] / SAMPLE_RATE
+        for piece in output["chunks"]:
+            start, end = piece["timestamp"]
+            if end is None:
+                end = (chunk["end"] - chunk["start"]) / SAMPLE_RATE
+            segments.append(SimpleNamespace(start=offset + start, end=offset + end, text=piece["text"]))
+    return segments, None
+
+def find_speech_chunks(audio):
+    """Detect voiced regions of audio, merged into windows of up to 30 s"""
+    return merge_segments(get_speech_timestamps(audio, VAD_OPTIONS), VAD_OPTIONS)
+
+def parse_worker_setting():
+    """Read WHISPER_WORKERS as a positive integer, or None if it is unset or malformed"""
+    value = os.environ.get("WHISPER_WORKERS", "").strip()
+    if value.isdigit() and int(value) > 0:
+        return int(value)
+    return None
+
+def get_worker_count():
+    """Number of parallel transcription workers: WHISPER_WORKERS if set, otherwise one per GPU"""
+    return parse_worker_setting() or ctranslate2.get_cuda_device_count()
+
+def use_worker_pool(workers):
+    """Check if transcription should run in worker processes rather than a model in this process"""
+    return workers > 1 and not use_openvino()
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def get_worker_pool(model_name, compute_type, workers):
+    """Start a pool of worker processes that each load the model once and serve every later request"""
+    device = "cuda" if has_cuda() else "cpu"
+    device_count = ctranslate2.get_cuda_device_count() if has_cuda() else 1
+    # Spawn rather than fork, since CUDA can't be used from a forked process
+    context = multiprocessing.get_context("spawn")
+    device_queue = context.Queue()
+    for i in range(workers):
+        device_queue.put(i % device_count)
+    cpu_threads = max(1, (os.cpu_count() or 1) // workers)
+    # An evicted pool shuts its workers down once it is garbage collected
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=transcription_worker.init_worker,
+        initargs=(model_name, device, compute_type, BATCH_SIZES[model_name], device_queue, cpu_threads)
+    )
+    # Workers start lazily, so submit one no-op per worker to start every model loading right away
+    for _ in range(workers):
+        executor.submit(transcription_worker.ready)
+    return executor
+
+def transcribe_parallel(executor, audio, model_name, word_timestamps, workers):
+    """Split voiced chunks into contiguous groups and transcribe each group in its own worker process"""
+    speech_chunks = find_speech_chunks(audio)
+    # Each worker batches its own chunks, so only split as far as every worker still gets a full batch
+    group_count = max(1, min(workers, len(speech_chunks) // BATCH_SIZES[model_name]))
+    groups = [group for group in np.array_split(np.arange(len(speech_chunks)), group_count) if len(group)]
+    futures = []
+    for group in groups:
+        # Chunks never split mid-word, since they come from VAD boundaries
+        start = speech_chunks[group[0]]["start"]
+        end = speech_chunks[group[-1]]["end"]
+        clip_timestamps = [
+            {"start": speech_chunks[i]["start"] - start, "end": speech_chunks[i]["end"] - start}
+            for i in group
+        ]
+        futures.append((start / SAMPLE_RATE, executor.submit(
+            transcription_worker.transcribe_chunk, audio[start:end], clip_timestamps, word_timestamps
+        )))
+    # Yield groups in order so segments still stream into the UI as they complete
+    for offset, future in futures:
+        try:
+            results = future.result()
+        except BrokenProcessPool:
+            # Drop the dead pool so the next request starts a fresh one
+            get_worker_pool.clear()
+            raise
+        for seg_start, seg_end, text in results:
+            yield SimpleNamespace(start=offset + seg_start, end=offset + seg_end, text=text)
+
+def transcribe_audio(model, audio, model_name, word_timestamps):
+    """Transcribe only the voiced regions of audio, batching them on the GPU for longer files"""
+    speech_chunks = find_speech_chunks(audio)
+    if not speech_chunks:
+        return [], None
+    if not isinstance(model, WhisperModel):
+        return transcribe_openvino(model, audio, speech_chunks)
+    # Clip timestamps keep segment times relative to the original audio, so no offsetting is needed
+    if len(audio) / SAMPLE_RATE < BATCHED_MIN_DURATION:
+        clip_timestamps = [t / SAMPLE_RATE for chunk in speech_chunks for t in (chunk["start"], chunk["end"])]
+        return model.transcribe(audio, word_timestamps=word_timestamps, clip_timestamps=clip_timestamps)
+    batched_model = BatchedInferencePipeline(model=model)
+    return batched_model.transcribe(
+        audio,
+        batch_size=BATCH_SIZES[model_name],
+        word_timestamps=word_timestamps,
+        clip_timestamps=speech_chunks
+    )
+
+def format_timestamp(seconds):
+    """Format seconds as an H:MM:SS,mmm subtitle timestamp"""
+    ms = round(seconds * 1000)
+    h, ms = divmod(ms, 3_600_000)
+    m, ms = divmod(ms, 60_000)
+    s, ms = divmod(ms, 1000)
+    return f"{h:01d}:{m:02d}:{s:02d},{ms:03d}"
+
+def load_audio(file_name, file_bytes):
+    """Decode an uploaded file to 16 kHz mono float32 PCM"""
+    if file_name.lower().endswith(".wav"):
+        audio = read_pcm_wav(file_bytes, SAMPLE_RATE)
+        if audio is not None:
+            return audio
+    if not file_name.lower().endswith(VIDEO_EXTENSIONS):
+        return decode_audio(io.BytesIO(file_bytes), sampling_rate=SAMPLE_RATE)
+    # Video containers need a seekable input, so they still go through a temporary file.
+    # FAST_TMP can point this at a RAM disk such as /dev/shm.
+    with tempfile.TemporaryDirectory(dir=os.environ.get("FAST_TMP")) as tmp_dir:
+        tmp_file_path = os.path.join(tmp_dir, os.path.basename(file_name))
+        with open(tmp_file_path, "wb") as tmp_file:
+            tmp_file.write(file_bytes)
+        return extract_audio_from_video(tmp_file_path)
+
+def stream_transcription(model_name, compute_type, word_timestamps, file_name, file_bytes):
+    """Yield transcribed segments as plain dicts as soon as the model produces them"""
+    workers = get_worker_count()
+    if use_worker_pool(workers):
+        # Every file goes through the pool, so no model is ever loaded on a device in this process.
+        # Getting the pool first lets any workers that are still loading their models do so while the audio decodes.
+        pool = get_worker_pool(model_name, compute_type, workers)
+        audio = load_audio(file_name, file_bytes)
+        segments = transcribe_parallel(pool, audio, model_name, word_timestamps, workers)
+    else:
+        # Decoding and model loading are independent, so decode in the background while the model loads.
+        # The model stays on the script thread since cached resources need Streamlit's script context.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            audio_future = executor.submit(load_audio, file_name, file_bytes)
+            model = get_whisper_model(model_name, compute_type)
+            audio = audio_future.result()
+        segments, _ = transcribe_audio(model, audio, model_name, word_timestamps)
+    for segment in segments:
+        yield {'start': segment.start, 'end': segment.end, 'text': segment.text}
+
+def run_transcription(model_name, compute_type, word_timestamps, file_name, file_bytes):
+    """Transcribe an uploaded file, showing text as it arrives and caching the result by model and file content"""
+    key = (model_name, compute_type, word_timestamps, hashlib.sha256(file_bytes).hexdigest())
+    transcriptions = st.session_state.setdefault("transcriptions", {})
+    if key in transcriptions:
+        return transcriptions[key]
+
+    placeholder = st.empty()
+    live_view = placeholder.container()
+    segments = []
+    for segment in stream_transcription(model_name, compute_type, word_timestamps, file_name, file_bytes):
+        segments.append(segment)
+        # Append each batch as its own plain-text element, so only new text is sent and nothing is parsed as markdown
+        if len(segments) % STREAM_UPDATE_EVERY == 0:
+            live_view.text("".join(s['text'] for s in segments[-STREAM_UPDATE_EVERY:]).strip())
+    placeholder.empty()
+
+    transcriptions[key] = {'text': "".join(s['text'] for s in segments).strip(), 'segments': segments}
+    # Dicts keep insertion order, so the first key is the oldest result
+    while len(transcriptions) > TRANSCRIPTION_CACHE_SIZE:
+        del transcriptions[next(iter(transcriptions))]
+    return transcriptions[key]
 
 def create_subtitle_timestamps(segments):
     """Create subtitles with proper timestamps"""
-    subs = []
-    for i, segment in enumerate(segments, 1):
-        start = datetime.timedelta(seconds=segment['start'])
-        end = datetime.timedelta(seconds=segment['end'])
-        text = segment['text'].strip()
-        subs.append({
+    return [
+        {
             'index': i,
-            'start': str(start).replace('.', ',')[:11],
-            'end': str(end).replace('.', ',')[:11],
-            'text': text
-        })
-    return subs
+            'start': format_timestamp(segment['start']),
+            'end': format_timestamp(segment['end']),
+            'text': segment['text'].strip()
+        }
+        for i, segment in enumerate(segments, 1)
+    ]
 
 def generate_srt_content(subtitles):
     """Generate SRT format content"""
-    srt_content = ""
-    for sub in subtitles:
-        srt_content += f"{sub['index']}\n"
-        srt_content += f"{sub['start']} --> {sub['end']}\n"
-        srt_content += f"{sub['text']}\n\n"
-    return srt_content
+    return "".join(
+        f"{sub['index']}\n{sub['start']} --> {sub['end']}\n{sub['text']}\n\n"
+        for sub in subtitles
+    )
 
 def generate_vtt_content(subtitles):
     """Generate VTT format content"""
-    vtt_content = "WEBVTT\n\n"
-    for sub in subtitles:
-        vtt_content += f"{sub['start']} --> {sub['end']}\n"
-        vtt_content += f"{sub['text']}\n\n"
-    return vtt_content
+    return "WEBVTT\n\n" + "".join(
+        f"{sub['start']} --> {sub['end']}\n{sub['text']}\n\n"
+        for sub in subtitles
+    )
+
+@st.fragment
+def edit_panel(initial_srt):
+    """Subtitle editor that reruns on its own, so edits never re-run transcription"""
+    st.subheader("Edit Subtitles:")
+    st.markdown("Edit the subtitles below. Each subtitle should be in the format: `[start] --> [end]` followed by the text.")
+    
+    # Keep edits in session state so they survive outer reruns, resetting only for a new transcription
+    # The widget's state is dropped on full reruns where the editor isn't shown, so seed it again then too
+    if st.session_state.get("edited_srt_source") != initial_srt or "edited_srt" not in st.session_state:
+        st.session_state["edited_srt_source"] = initial_srt
+        st.session_state["edited_srt"] = initial_srt
+    
+    # Create a text area with the current subtitles for editing, bound to the session state above
+    edited_subtitles = st.text_area(
+        "Edit subtitles",
+        key="edited_srt",
+        height=400
+    )
+    
+    # Download edited subtitles
+    if st.button("Update Subtitles"):
+        st.download_button(
+            label="Download Edited SRT",
+            data=edited_subtitles,
+            file_name="edited_subtitles.srt",
+            mime="text/plain"
+        )
 
 # Set page configuration
 st.set_page_config(
@@ -90,9 +431,16 @@ if not check_ffmpeg():
     If you're using Streamlit Cloud, please ensure `packages.txt` contains `ffmpeg`.
     """)
 
+# A malformed worker setting falls back to one worker per GPU
+if os.environ.get("WHISPER_WORKERS", "").strip() and parse_worker_setting() is None:
+    st.warning(f"Ignoring WHISPER_WORKERS={os.environ['WHISPER_WORKERS']!r}: expected a positive integer.")
+
 # Available Whisper models
 WHISPER_MODELS = ["tiny", "base", "small", "medium", "large"]
 
+# Precision modes, trading accuracy for throughput
+QUALITY_MODES = ["Speed", "Quality"]
+
 # Sidebar for model selection
 with st.sidebar:
     st.header("Model Configuration")
@@ -101,6 +449,24 @@ with st.sidebar:
         WHISPER_MODELS,
         help="Choose the Whisper model to use for transcription. Larger models are more accurate but slower."
     )
+    # The OpenVINO backend ignores precision and word timing, so those controls are disabled there
+    openvino = use_openvino()
+    quality_mode = st.radio(
+        "Quality vs Speed",
+        QUALITY_MODES,
+        horizontal=True,
+        disabled=openvino,
+        help="Not available with the OpenVINO backend, which picks its own precision." if openvino else
+        "Speed runs the model with int8 weights, Quality with float16 (float32 on CPU). Quality lowers the error rate at the cost of speed and memory."
+    )
+    compute_type = get_compute_type(quality_mode)
+    word_timestamps = st.checkbox(
+        "Word-level timestamps",
+        value=False,
+        disabled=openvino,
+        help="Not available with the OpenVINO backend." if openvino else
+        "Align subtitle boundaries to individual words. More precise timing, but slower."
+    ) and not openvino
     
     st.markdown("""
     ### Model Information
@@ -111,6 +477,10 @@ with st.sidebar:
     - **large**: Most accurate, slowest
     """)
 
+# Preload the default model so the first transcription doesn't pay the load cost
+with st.spinner(f"Loading {WHISPER_MODELS[0]} model..."):
+    preload_default_model()
+
 # File upload - now supporting more formats
 file = st.file_uploader(
     "Upload an audio/video file",
@@ -124,28 +494,15 @@ if file is not None:
         transcribe_button = st.button("Transcribe", type="primary", use_container_width=True)
     
     if transcribe_button:
-        # Create a temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.name)[1]) as tmp_file:
-            tmp_file.write(file.getvalue())
-            tmp_file_path = tmp_file.name
-
         try:
             # Handle video files
-            if tmp_file_path.lower().endswith(('.mp4', '.avi', '.mkv', '.mov')):
-                if not check_ffmpeg():
-                    st.error("Cannot process video files without FFmpeg. Please upload an audio file instead.")
-                    st.stop()
-                audio_path = extract_audio_from_video(tmp_file_path)
-                process_path = audio_path
-            else:
-                process_path = tmp_file_path
-
-            with st.spinner(f"Loading {selected_model} model..."):
-                model = whisper.load_model(selected_model)
-
-            with st.spinner("Transcribing..."):
-                # Perform transcription with word-level timestamps
-                result = model.transcribe(process_path, word_timestamps=True)
+            if file.name.lower().endswith(VIDEO_EXTENSIONS) and not check_ffmpeg():
+                st.error("Cannot process video files without FFmpeg. Please upload an audio file instead.")
+                st.stop()
+
+            with st.spinner(f"Transcribing with the {selected_model} model..."):
+                # Streams partial text while running; cached on the file content so reruns don't transcribe again
+                result = run_transcription(selected_model, compute_type, word_timestamps, file.name, file.getvalue())
                 
                 # Create subtitles with timestamps
                 subtitles = create_subtitle_timestamps(result["segments"])
@@ -158,7 +515,14 @@ if file is not None:
                 
                 with transcript_tab:
                     st.subheader("Full Transcript:")
-                    st.write(result["text"])
+                    transcript = result["text"]
+                    if len(transcript) <= TRANSCRIPT_PAGE_THRESHOLD:
+                        st.text_area("Full Transcript", transcript, height=400, disabled=True, label_visibility="collapsed")
+                    else:
+                        # Very long transcripts are split into collapsed pages so the browser stays responsive
+                        for page, i in enumerate(range(0, len(transcript), TRANSCRIPT_PAGE_SIZE), 1):
+                            with st.expander(f"Page {page}"):
+                                st.text(transcript[i:i + TRANSCRIPT_PAGE_SIZE])
                     
                     # Download full transcript
                     st.download_button(
@@ -196,35 +560,12 @@ if file is not None:
                         )
                 
                 with edit_tab:
-                    st.subheader("Edit Subtitles:")
-                    st.markdown("Edit the subtitles below. Each subtitle should be in the format: `[start] --> [end]` followed by the text.")
-                    
-                    # Create a text area with the current subtitles for editing
-                    edited_subtitles = st.text_area(
-                        "Edit subtitles",
-                        value=srt_content,
-                        height=400
-                    )
-                    
-                    # Download edited subtitles
-                    if st.button("Update Subtitles"):
-                        st.download_button(
-                            label="Download Edited SRT",
-                            data=edited_subtitles,
-                            file_name="edited_subtitles.srt",
-                            mime="text/plain"
-                        )
+                    edit_panel(srt_content)
 
         except Exception as e:
             st.error(f"An error occurred: {str(e)}")
             if "FFmpeg" in str(e):
                 st.info("💡 For video files, FFmpeg is required. Please check the installation instructions in the README.")
-        
-        finally:
-            # Clean up temporary files
-            os.unlink(tmp_file_path)
-            if 'audio_path' in locals() and os.path.exists(audio_path):
-                os.unlink(audio_path)
     else:
         st.info("Press the Transcribe button when you're ready to start the transcription.")
 else:
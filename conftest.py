@@ -0,0 +1 @@
+# Lets tests import the app's helper modules from the repository root
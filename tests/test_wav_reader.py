@@ -0,0 +1,53 @@
+import io
+import struct
+import wave
+
+import numpy as np
+
+from wav_reader import read_pcm_wav
+
+
+def make_wav(samples, rate=16000, channels=1, sample_width=2):
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(sample_width)
+        wav.setframerate(rate)
+        wav.writeframes(np.asarray(samples, np.int16).tobytes())
+    return buffer.getvalue()
+
+
+def insert_chunk(wav_bytes, chunk_id, payload):
+    """Insert a chunk between the RIFF header and the fmt chunk, fixing up the RIFF size"""
+    chunk = chunk_id + struct.pack("<I", len(payload)) + payload + b"\0" * (len(payload) % 2)
+    body = wav_bytes[12:]
+    riff = b"RIFF" + struct.pack("<I", 4 + len(chunk) + len(body)) + b"WAVE"
+    return riff + chunk + body
+
+
+def test_reads_16khz_mono_pcm():
+    audio = read_pcm_wav(make_wav([0, 16384, -32768]))
+    assert audio.dtype == np.float32
+    np.testing.assert_allclose(audio, [0.0, 0.5, -1.0])
+
+
+def test_skips_extra_chunks_with_odd_size_padding():
+    wav_bytes = insert_chunk(make_wav([16384]), b"LIST", b"INFOabc")
+    np.testing.assert_allclose(read_pcm_wav(wav_bytes), [0.5])
+
+
+def test_rejects_other_sample_rates():
+    assert read_pcm_wav(make_wav([0, 1], rate=44100)) is None
+
+
+def test_rejects_stereo():
+    assert read_pcm_wav(make_wav([0, 1], channels=2)) is None
+
+
+def test_rejects_non_wav():
+    assert read_pcm_wav(b"ID3\x03" + b"\0" * 40) is None
+
+
+def test_truncated_fmt_chunk_falls_back():
+    wav_bytes = make_wav([0])
+    assert read_pcm_wav(wav_bytes[:30]) is None
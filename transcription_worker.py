@@ -0,0 +1,41 @@
+"""Worker processes for transcribing long audio in parallel
+
+Kept out of app.py because Streamlit runs app.py as a script, so its functions
+can't be pickled and sent to other processes.
+"""
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+
+# Each worker process loads its own copy of the model once, in init_worker
+_pipeline = None
+_batch_size = None
+
+def init_worker(model_name, device, compute_type, batch_size, device_queue, cpu_threads):
+    """Pin this worker to one device and load its model behind a batched pipeline"""
+    global _pipeline, _batch_size
+    device_index = device_queue.get()
+    model = WhisperModel(
+        model_name,
+        device=device,
+        device_index=device_index,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads
+    )
+    _pipeline = BatchedInferencePipeline(model=model)
+    _batch_size = batch_size
+
+def transcribe_chunk(audio, clip_timestamps, word_timestamps):
+    """Transcribe the clipped regions of an audio slice, returning (start, end, text) tuples
+
+    clip_timestamps are {"start", "end"} sample offsets relative to the slice.
+    """
+    segments, _ = _pipeline.transcribe(
+        audio,
+        batch_size=_batch_size,
+        word_timestamps=word_timestamps,
+        clip_timestamps=clip_timestamps
+    )
+    return [(segment.start, segment.end, segment.text) for segment in segments]
+
+def ready():
+    """No-op task, submitted so the pool starts a worker and loads its model ahead of real work"""
+    return True
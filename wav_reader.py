@@ -0,0 +1,33 @@
+"""Fast path for WAV uploads that are already in Whisper's input format
+
+Kept out of app.py so it can be imported without running the Streamlit script.
+"""
+import struct
+import numpy as np
+
+def read_pcm_wav(file_bytes, sample_rate=16000):
+    """Read samples from a WAV file that is already mono 16-bit PCM at sample_rate, or return None if it needs decoding"""
+    if file_bytes[:4] != b"RIFF" or file_bytes[8:12] != b"WAVE":
+        return None
+    fmt = None
+    pos = 12
+    # Walk the chunks rather than assuming a 44-byte header, since extra chunks like LIST are common
+    while pos + 8 <= len(file_bytes):
+        chunk_id = file_bytes[pos:pos + 4]
+        chunk_size = int.from_bytes(file_bytes[pos + 4:pos + 8], "little")
+        body = pos + 8
+        if chunk_id == b"fmt " and chunk_size >= 16:
+            # A truncated header can't be trusted, so leave it to the regular decoder
+            if body + 16 > len(file_bytes):
+                return None
+            audio_format, channels, rate, _, _, bits_per_sample = struct.unpack("<HHIIHH", file_bytes[body:body + 16])
+            fmt = (audio_format, channels, rate, bits_per_sample)
+        elif chunk_id == b"data":
+            if fmt != (1, 1, sample_rate, 16):
+                return None
+            data = file_bytes[body:body + chunk_size]
+            data = data[:len(data) - len(data) % 2]
+            return np.frombuffer(data, np.int16).astype(np.float32) / 32768.0
+        # Chunks are padded to an even size
+        pos = body + chunk_size + chunk_size % 2
+    return None